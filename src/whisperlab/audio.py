@@ -1,9 +1,17 @@
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
-import pydub
+import scipy.signal
+import soundfile
 import whisper.audio
 
+try:
+    from numba import njit
+except ImportError:  # Fall back to the NumPy slice path in roll()
+    njit = None
+
 
 # Constants ===================================================================
 
@@ -79,30 +87,61 @@ def ValidateAudioArray(audio: np.ndarray, dtype=np.float32):
     """
 
     # Verify that the audio array is not empty
-    if len(audio) == 0:
+    if audio.size == 0:
         raise EmptyArray(f"Audio array is empty: {audio}")
 
     # Verify that the audio array is the correct type
     if audio.dtype != dtype:
         raise ArrayTypeError(f"Audio array is not {dtype}: {audio}")
 
-    if np.any(np.abs(audio) > 1):
-        raise AudioOverflow("Audio overflow")
+    # Two fused reductions; no abs/bool temporaries over the full buffer.
+    # The only check that scans the whole buffer; skipped under -O.
+    if __debug__:
+        if audio.min() < -1.0 or audio.max() > 1.0:
+            raise AudioOverflow("Audio overflow")
 
 
 # Converters ==================================================================
 
 
-def float32_to_int16(audio: np.ndarray):
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _float32_to_int16_kernel(audio, out):
+        """Fused scale + round + clamp + cast behind float32_to_int16."""
+        scale = np.float32(32767.0)  # float32 product, matching the fallback
+        for i in range(audio.shape[0]):
+            value = np.rint(audio[i] * scale)
+            if value > 32767.0:
+                value = 32767.0
+            elif value < -32768.0:
+                value = -32768.0
+            out[i] = value
+
+    # Warm the JIT alongside the roll kernel
+    _float32_to_int16_kernel(
+        np.zeros(1, dtype=np.float32), np.empty(1, dtype=np.int16)
+    )
+else:
+    _float32_to_int16_kernel = None
+
+
+def float32_to_int16(
+    audio: np.ndarray, out: np.ndarray = None, validate: bool = True
+):
     """
     Convert a float32 array to int16
 
-    Maps the float32 range [-1, 1] to the int16 range [-32768, 32767]
-
-    May mangle samples outside [-1, 1 ].
+    Maps the float32 range [-1, 1] to the int16 range [-32767, 32767].
+    Scaling by 32767 keeps +1.0 in range; values are rounded and clamped
+    before the single cast into the output buffer.
 
     Args:
         audio (np.ndarray): The audio array to convert
+        out (np.ndarray): Optional preallocated int16 buffer to reuse
+        validate (bool): Whether to validate the audio array first.
+            Streaming callers with a trusted source can pass False to
+            skip the full-buffer range scan.
 
     Returns:
         np.ndarray: The converted audio array
@@ -110,19 +149,60 @@ def float32_to_int16(audio: np.ndarray):
     Raises:
         Exception: If the audio array contains samples outside [-1, 1]
     """
-    ValidateAudioArray(audio)
-    return (audio * 32_768).astype(np.int16)
+    if validate:
+        ValidateAudioArray(audio)
+    if out is None:
+        out = np.empty(audio.shape, dtype=np.int16)
+    if _float32_to_int16_kernel is not None:
+        _float32_to_int16_kernel(audio, out)
+        return out
+
+    # NumPy fallback when numba is unavailable
+    scaled = np.multiply(audio, 32_767.0)
+    np.rint(scaled, out=scaled)
+    np.clip(scaled, -32_768, 32_767, out=scaled)
+    out[:] = scaled  # Single float to int16 cast
+    return out
 
 
 # Operators ===================================================================
 
 
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _roll_inplace(buffer, samples):
+        """Compiled memmove + tail copy behind roll()."""
+        buffer_size = buffer.shape[0]
+        sample_count = samples.shape[0]
+        if sample_count >= buffer_size:
+            for i in range(buffer_size):
+                buffer[i] = samples[sample_count - buffer_size + i]
+        else:
+            for i in range(buffer_size - sample_count):
+                buffer[i] = buffer[i + sample_count]
+            for i in range(sample_count):
+                buffer[buffer_size - sample_count + i] = samples[i]
+
+    # Warm the JIT so the first streaming frame does not pay compile cost
+    _roll_inplace(
+        np.zeros(2, dtype=np.float32), np.zeros(1, dtype=np.float32)
+    )
+else:
+    _roll_inplace = None
+
+
 def roll(buffer: np.ndarray, samples: np.ndarray):
     """
     Roll new samples into a numpy array.
 
     If the samples are longer than the buffer, use use the last samples.
 
+    Mutates the buffer in place: the retained prefix is shifted left with
+    a memmove-style slice copy and the new samples fill the tail, so no
+    full-buffer temporary is allocated. Callers that need the old buffer
+    should pass in a copy.
+
     Example:
         >>> roll(np.zeros(3), np.array([1, 2, 3, 4]))
         array([2., 3., 4.])
@@ -131,9 +211,7 @@ def roll(buffer: np.ndarray, samples: np.ndarray):
         array([0., 1., 2.])
 
         >>> roll(np.array([1, 2, 3]), np.array([4, 5]))
-        array([3., 4., 5.])
-
-
+        array([3, 4, 5])
 
     Args:
         buffer (np.ndarray): The buffer to roll the samples into
@@ -143,11 +221,19 @@ def roll(buffer: np.ndarray, samples: np.ndarray):
         np.ndarray: The updated buffer
     """
 
-    if len(samples) > len(buffer):
-        return samples[-len(buffer) :]
-    left_shift = -len(samples)
-    buffer = np.roll(buffer, left_shift)
-    buffer[left_shift:] = samples
+    if _roll_inplace is not None:
+        _roll_inplace(buffer, samples)
+        return buffer
+
+    # NumPy fallback when numba is unavailable
+    buffer_size = buffer.shape[0]
+    sample_count = samples.shape[0]
+    if sample_count >= buffer_size:
+        buffer[:] = samples[-buffer_size:]
+        return buffer
+    keep = buffer_size - sample_count
+    buffer[:keep] = buffer[sample_count:]  # memmove the retained prefix
+    buffer[keep:] = samples
     return buffer
 
 
@@ -169,13 +255,46 @@ class WaveBuffer:
     """
 
     buffer: np.ndarray
+    block_size: int | None
+
+    def __init__(self, buffer_size: int, block_size: int | None = None):
+        # float32 to match the audio arrays everywhere else in the module;
+        # the float64 default would silently upcast every put()
+        self.buffer = np.zeros(buffer_size, dtype=np.float32)
+        self.block_size = block_size
+
+        # The buffer and block sizes are constants for the session, so
+        # specialize a roll kernel with the bounds baked in
+        if block_size is not None and block_size < buffer_size:
+            split = buffer_size - block_size
 
-    def __init__(self, buffer_size: int):
-        self.buffer = np.zeros(buffer_size)
+            def roll_fixed(buffer, samples):
+                # Bounds are session constants; no per-call length reads
+                buffer[:split] = buffer[block_size:]
+                buffer[split:] = samples
+                return buffer
+
+            self._roll_fixed = roll_fixed
+        else:
+            self._roll_fixed = None
 
     def get(self):
         return self.buffer
 
+    def roll(self, samples):
+        """
+        Roll samples into the buffer.
+
+        Uses the specialized kernel when the samples match the declared
+        block size, and the generic roll() otherwise.
+        """
+        if (
+            self._roll_fixed is not None
+            and samples.shape[0] == self.block_size
+        ):
+            return self._roll_fixed(self.buffer, samples)
+        return roll(self.buffer, samples)
+
     def put(self, audio_samples):
         """Convert the audio samples to a plot buffer."""
         self.buffer = self.process(audio_samples)
@@ -184,21 +303,161 @@ class WaveBuffer:
         return audio_samples
 
 
+# Loaders =====================================================================
+
+
+SOUNDFILE_SUFFIXES = {".wav", ".flac"}  # Formats libsndfile reads directly
+
+
+def load_audio_file(audio_file: Path) -> np.ndarray:
+    """
+    Load an audio file as a mono float32 array at the Whisper frame rate.
+
+    WAV and FLAC files are read directly with libsndfile, downmixed, and
+    resampled only when needed. Other formats are decoded by piping raw
+    float32 samples out of an ffmpeg subprocess.
+
+    Args:
+        audio_file (Path): Path to the audio file to load
+
+    Returns:
+        np.ndarray: The audio samples as a mono float32 array
+    """
+
+    ValidateAudioFile(audio_file)
+
+    # Fast path: read WAV/FLAC directly with libsndfile
+    if audio_file.suffix.lower() in SOUNDFILE_SUFFIXES:
+        samples, sample_rate = soundfile.read(
+            str(audio_file), dtype="float32", always_2d=False
+        )
+        if samples.ndim == 2:  # Downmix multi-channel audio
+            samples = samples.mean(axis=1, dtype=np.float32)
+        if sample_rate != SAMPLES_PER_SECOND:
+            samples = scipy.signal.resample_poly(
+                samples, SAMPLES_PER_SECOND, sample_rate
+            ).astype(np.float32)
+        return samples
+
+    # Fallback: decode any other format through an ffmpeg pipe
+    raw_samples = subprocess.run(
+        [
+            "ffmpeg",
+            "-v", "quiet",
+            "-i", str(audio_file),
+            "-f", "f32le",
+            "-ac", "1",
+            "-ar", str(SAMPLES_PER_SECOND),
+            "pipe:1",
+        ],
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    return np.frombuffer(raw_samples, dtype=np.float32)
+
+
+CHUNK_SAMPLES = 30 * SAMPLES_PER_SECOND  # 30 seconds of audio per chunk
+
+
+def iter_audio_chunks(audio_file: Path, chunk_samples: int = CHUNK_SAMPLES):
+    """
+    Stream an audio file as fixed-size mono float32 chunks.
+
+    Unlike load_audio_file, only one chunk is resident at a time, so peak
+    memory is O(chunk) rather than O(file) and hour-long recordings can
+    be processed without decoding them whole. WAV/FLAC files already at
+    the Whisper frame rate are block-read with libsndfile; everything
+    else (including files needing resampling) streams through an ffmpeg
+    pipe read chunk by chunk.
+
+    Args:
+        audio_file (Path): Path to the audio file to stream
+        chunk_samples (int): Samples per yielded chunk
+
+    Yields:
+        np.ndarray: Mono float32 chunks of up to chunk_samples samples
+    """
+
+    ValidateAudioFile(audio_file)
+
+    # Fast path: block-read WAV/FLAC already at the Whisper frame rate
+    if audio_file.suffix.lower() in SOUNDFILE_SUFFIXES:
+        if soundfile.info(str(audio_file)).samplerate == SAMPLES_PER_SECOND:
+            for block in soundfile.blocks(
+                str(audio_file),
+                blocksize=chunk_samples,
+                dtype="float32",
+                always_2d=False,
+            ):
+                if block.ndim == 2:  # Downmix multi-channel audio
+                    block = block.mean(axis=1, dtype=np.float32)
+                yield block
+            return
+
+    # Fallback: stream the decoded f32le ffmpeg pipe chunk by chunk
+    process = subprocess.Popen(
+        [
+            "ffmpeg",
+            "-v", "quiet",
+            "-i", str(audio_file),
+            "-f", "f32le",
+            "-ac", "1",
+            "-ar", str(SAMPLES_PER_SECOND),
+            "pipe:1",
+        ],
+        stdout=subprocess.PIPE,
+    )
+    chunk_bytes = chunk_samples * np.dtype(np.float32).itemsize
+    try:
+        while True:
+            raw_chunk = process.stdout.read(chunk_bytes)
+            if not raw_chunk:
+                break
+            yield np.frombuffer(raw_chunk, dtype=np.float32)
+    finally:
+        process.stdout.close()
+        process.wait()
+
+
 # Exporters ===================================================================
 
 
-def save_audio(audio: np.ndarray, path: Path):
+# Write pool: overlaps wav encoding + disk latency with the caller's next
+# compute step. libsndfile releases the GIL, so the overlap is real.
+# The pool joins its pending writes at interpreter exit.
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def save_audio(audio: np.ndarray, path: Path, validate: bool = True):
     """
-    Save an audio array to a file
+    Save an audio array to a 16-bit PCM wav file
+
+    Writes the float32 array directly through libsndfile, which quantizes
+    to int16 in C. No intermediate int16 copy, no ffmpeg subprocess.
+
+    The write is submitted to a small I/O pool so it overlaps with the
+    caller's next compute step. Fire-and-forget callers can ignore the
+    returned future; call .result() to block until the file is on disk.
 
     Args:
         audio (np.ndarray): The audio array to save
         path (Path): The path to save the audio to
+        validate (bool): Whether to validate the audio array first
+
+    Returns:
+        concurrent.futures.Future: The pending write
     """
 
-    pydub.AudioSegment(
-        float32_to_int16(audio).tobytes(),
-        frame_rate=SAMPLES_PER_SECOND,
-        sample_width=2,
-        channels=1,
-    ).export(path, format="wav")
+    if validate:
+        ValidateAudioArray(audio)
+    # libsndfile streams the float32 samples straight into the PCM_16
+    # file; compact strided views once here rather than inside the write
+    audio = np.ascontiguousarray(audio)
+    return _IO_POOL.submit(
+        soundfile.write,
+        str(path),
+        audio,
+        SAMPLES_PER_SECOND,
+        subtype="PCM_16",
+        format="WAV",
+    )
@@ -230,6 +230,83 @@ class Recorder:
         self.model.put(samples)
 
 
+class Microphone:
+    """
+    Blocking-read microphone serving fixed-size mono sample windows.
+
+    get() reads one window from the stream and downmixes the channel
+    data into a single preallocated contiguous buffer, so steady-state
+    reads reuse one allocation instead of mallocing a fresh (N, C) array
+    view chain per call. Multi-channel devices are averaged rather than
+    truncated to channel 1, so no signal is discarded.
+    """
+
+    stream: sounddevice.InputStream
+    window_samples: int
+    buffer: np.ndarray
+
+    def __init__(
+        self,
+        window_samples: int,
+        samplerate=SAMPLES_PER_SECOND,
+        channels: int = 1,
+    ):
+        self.window_samples = window_samples
+        self.buffer = np.empty(window_samples, dtype=np.float32)
+        self.stream = sounddevice.InputStream(
+            channels=channels,
+            blocksize=window_samples,
+            samplerate=samplerate,
+        )
+
+    def start(self):
+        self.stream.start()
+
+    def stop(self):
+        self.stream.stop()
+
+    def get(self):
+        """Read one window of mono samples into the reused buffer."""
+        samples, overflowed = self.stream.read(self.window_samples)
+        if overflowed:
+            raise Exception("Unexpected overflow")
+        # Fused downmix straight into the contiguous mono buffer
+        samples.mean(axis=1, dtype=np.float32, out=self.buffer)
+        return self.buffer
+
+
+class VirtualMicrophone:
+    """
+    Serve pre-recorded samples in fixed-size segments.
+
+    A stand-in for a live microphone: load an audio array once, then call
+    get() to read successive window-sized segments. The segments are a
+    zero-copy stride view over the source array, so construction cost is
+    independent of the audio length.
+    """
+
+    samples: np.ndarray
+    segments: int
+    window_samples: int
+
+    def __init__(self, samples: np.ndarray, window_samples: int):
+        # Trim to a whole number of segments; reshaping the contiguous
+        # prefix is a view, not a copy
+        whole_segments = len(samples) - (len(samples) % window_samples)
+        self.samples = samples[:whole_segments].reshape(-1, window_samples)
+        self.segments = self.samples.shape[0]
+        self.window_samples = window_samples
+        self.cursor = 0
+
+    def get(self):
+        """Return the next segment, or None once exhausted."""
+        if self.cursor >= self.segments:
+            return None
+        segment = self.samples[self.cursor]
+        self.cursor += 1
+        return segment
+
+
 def FrameBlockRecorder(model):
     return Recorder(model, blocksize=RAW_SAMPLES_PER_FRAME)
 
@@ -4,11 +4,13 @@ Whisper Runner Module
 This module can transcribe an audio file using Whisper.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from pydantic import FilePath
 import whisper
 
 import whisperlab.logging
+from .audio import load_audio_file
 from .tasks import Task
 
 
@@ -39,6 +41,26 @@ def EmptyFile(audio_file: Path):
     return audio_file.stat().st_size == 0
 
 
+# Model Cache =================================================================
+
+
+@lru_cache(maxsize=4)
+def get_model(name: str):
+    """
+    Load a whisper model, memoized by name.
+
+    Loading deserializes hundreds of MB of weights, so repeated
+    transcriptions reuse the already-loaded model.
+
+    Args:
+        name (str): The whisper model name
+
+    Returns:
+        whisper.Whisper: The loaded model
+    """
+    return whisper.load_model(name)
+
+
 # Models ======================================================================
 
 
@@ -59,6 +81,58 @@ class TranscribeTask(Task):
     model: str = DEFAULT_TRANSCRIPTION_MODEL
 
 
+# Sessions ====================================================================
+
+
+class WhisperSession:
+    """
+    A transcription session with the model loaded up front.
+
+    Session setup (the model load, and with it whisper's cached mel
+    filters) happens once in __init__; transcribe() then only pays the
+    per-request work of loading audio and running inference.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_TRANSCRIPTION_MODEL):
+        self.model_name = model_name
+        self.model = get_model(model_name)
+
+    def transcribe(self, task: TranscribeTask):
+        """
+        Run trancription on an audio file.
+
+        Args:
+            task (TranscribeTask): The trascription task to process.
+
+        Effects:
+            Logs the result.
+
+        Returns:
+            dict: The whisper result.
+        """
+
+        # Load and trim the audio file to 30 seconds
+        audio = load_audio_file(task.audio_file)
+        audio = whisper.pad_or_trim(audio)
+
+        # Log the audio file
+        log.info("Transcribing %s", task.audio_file)
+
+        # Transcribe the audio
+        result = self.model.transcribe(audio, fp16=False, **task.args)
+
+        # Log the result text
+        log.info("Transcription:\n%s", result["text"])
+
+        return result
+
+
+@lru_cache(maxsize=4)
+def get_session(model_name: str) -> WhisperSession:
+    """Look up or create the session for a model, memoized by name."""
+    return WhisperSession(model_name)
+
+
 # Use Case ====================================================================
 
 
@@ -68,6 +142,9 @@ def transcribe(
     """
     Run trancription on an audio file.
 
+    A thin wrapper that routes the task through the cached session for
+    its model.
+
     Args:
         task (TranscribeTask): The trascription task to process.
 
@@ -78,24 +155,8 @@ def transcribe(
         task (TranscribeTask): The trascription task with the result.
     """
 
-    # Validate empty audio files
+    # Validate empty audio files before touching the model
     if EmptyFile(task.audio_file):
         return EMPTY_RESULT
 
-    # Load and trim the audio file to 30 seconds
-    audio = whisper.load_audio(str(task.audio_file))
-    audio = whisper.pad_or_trim(audio)
-
-    # Log the audio file
-    log.info("Transcribing %s", task.audio_file)
-
-    # Fetch the model
-    model = whisper.load_model(task.model)
-
-    # Transcribe the audio
-    result = model.transcribe(audio, fp16=False, **task.args)
-
-    # Log the result text
-    log.info("Transcription:\n%s", result["text"])
-
-    return result
+    return get_session(task.model).transcribe(task)
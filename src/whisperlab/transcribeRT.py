@@ -1,11 +1,11 @@
 import atexit
 
 import datetime
-import sounddevice
 import numpy as np
 
 from whisperlab.transcribe import transcribe, TranscribeTask
 from whisperlab.logging import config_log
+from whisperlab.microphone import Microphone
 from whisperlab.time import time_ms, timestamp
 from whisperlab.audio import SAMPLES_PER_SECOND
 
@@ -18,12 +18,8 @@ SAMPLES_PER_WINDOW = SAMPLES_PER_SECOND * WINDOW_SECONDS
 
 def Usecase():
     # Setup the microphone
-    stream = sounddevice.InputStream(
-        channels=1,
-        blocksize=SAMPLES_PER_WINDOW,
-        samplerate=SAMPLES_PER_SECOND,
-    )
-    stream.start()
+    microphone = Microphone(SAMPLES_PER_WINDOW)
+    microphone.start()
 
     trancription = ""
 
@@ -37,10 +33,7 @@ def Usecase():
     for frame in range(12):
         time = time_ms()
         log.debug("Fetching Samples")
-        samples, overflowed = stream.read(SAMPLES_PER_WINDOW)
-        if overflowed:
-            raise Exception("Unexpected overflow")
-        samples = samples[:, 0]  # Unwrap channel 1
+        samples = microphone.get()
         log.debug(
             "Fetched %s samples in %s ms",
             len(samples),
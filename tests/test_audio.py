@@ -0,0 +1,41 @@
+import numpy as np
+
+from whisperlab.audio import float32_to_int16, roll
+
+
+# Test Conversion -------------------------------------------------------------
+
+
+def test_float32_to_int16_maps_full_scale():
+    audio = np.array([1.0, -1.0, 0.0, 0.5], dtype=np.float32)
+    result = float32_to_int16(audio)
+    assert result.dtype == np.int16
+    assert list(result) == [32767, -32767, 0, 16384]
+
+
+def test_float32_to_int16_reuses_output_buffer():
+    audio = np.zeros(4, dtype=np.float32)
+    out = np.empty(4, dtype=np.int16)
+    assert float32_to_int16(audio, out=out) is out
+
+
+# Test Roll -------------------------------------------------------------------
+
+
+def test_roll_shifts_and_appends():
+    buffer = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    result = roll(buffer, np.array([4.0, 5.0], dtype=np.float32))
+    assert result is buffer  # Mutates in place
+    assert list(result) == [3.0, 4.0, 5.0]
+
+
+def test_roll_with_short_samples():
+    buffer = np.zeros(3, dtype=np.float32)
+    result = roll(buffer, np.array([1.0, 2.0], dtype=np.float32))
+    assert list(result) == [0.0, 1.0, 2.0]
+
+
+def test_roll_with_long_samples_keeps_the_tail():
+    buffer = np.zeros(3, dtype=np.float32)
+    result = roll(buffer, np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32))
+    assert list(result) == [2.0, 3.0, 4.0]